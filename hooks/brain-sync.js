@@ -19,6 +19,7 @@ const {
   isReadOnlyTool,
   logDebug,
   cleanAnsi,
+  escapeRegExp,
   getTimestamp,
   readStdin,
   outputJson
@@ -26,7 +27,9 @@ const {
 
 const {
   readPreservedBrain,
+  readBrain,
   writeBrain,
+  appendToBrain,
   dedupe
 } = require('./lib/brain');
 
@@ -37,6 +40,62 @@ const LOG_PREFIX = '[BRAIN-SYNC]';
 const MAX_JSONL_SIZE = 50 * 1024 * 1024;
 const STREAMING_THRESHOLD = 50 * 1024 * 1024; // Use streaming for files > 50MB
 
+// Root entries that do not count as project files
+const META_ENTRIES = new Set(['.git', '.maestro', '.claude']);
+
+// Tools whose non-error results are still scanned for error output
+const EXECUTION_TOOLS = new Set(['run_command', 'browser_subagent', 'execute_python_code', 'Bash', 'Shell']);
+
+// Tools recorded as file edits / file writes
+const EDIT_TOOLS = new Set(['Edit', 'StrReplace', 'replace_file_content', 'multi_replace_file_content', 'search_replace']);
+const WRITE_TOOLS = new Set(['Write', 'write_to_file', 'write']);
+
+// Sentence boundaries used when picking a decision sentence out of a message
+const SENTENCE_SPLIT_REGEX = /[.!?]\s+/;
+
+// Keywords that mark a tool result as an error, even when is_error is unset
+const ERROR_KEYWORDS = [
+  'exit code 127', 'exit code 1', 'exit code 2', 'exit code',
+  'command not found', 'bash: command not found',
+  'is not recognized as an internal or external command',
+  'is not recognized as the name of a cmdlet',
+  'failed to compile', 'build failed', 'compilation failed',
+  'error:', 'typeerror:', 'syntaxerror:',
+  'referenceerror:', 'cannot find module', 'module not found',
+  'command failed', 'npm err!', 'npm error',
+  'fatal:', 'exception:', 'traceback',
+  'no such file or directory', 'permission denied',
+  'access is denied', 'cannot find the path specified',
+  'error: exit code', 'error exit code'
+];
+
+// Compiled once: a single case-insensitive scan instead of lowercasing the
+// content and calling includes() per keyword
+const ERROR_KEYWORD_REGEX = new RegExp(
+  ERROR_KEYWORDS.map(escapeRegExp).join('|'),
+  'i'
+);
+
+// Phrases that mark an assistant message as recording a decision
+const DECISION_INDICATORS = [
+  'the user wants', 'user requested', 'requirements:',
+  'architecture:', 'design decision:', 'chosen approach:',
+  'will use', 'decided to', 'going with', 'selected',
+  'because', 'reason:', 'rationale:', 'plan:', 'strategy:'
+];
+
+// One alternation scan per message/sentence instead of an includes() per phrase
+const DECISION_INDICATOR_REGEX = new RegExp(
+  DECISION_INDICATORS.map(escapeRegExp).join('|'),
+  'i'
+);
+
+// Message openers that signal transient narration rather than a decision
+const SKIP_INDICATORS = [
+  'Let me', 'Now let', "I will try", "I'll try",
+  'First,', 'Next,', 'Then,', 'Now I'
+];
+
 /**
  * Detect active Claude CLI session from cwd.
  */
@@ -48,7 +107,7 @@ function getActiveSession(projectRoot) {
     // Only check if it's a directory (might be a newly created empty folder)
     if (fs.existsSync(projectRoot) && fs.lstatSync(projectRoot).isDirectory()) {
       const rootEntries = fs.readdirSync(projectRoot);
-      const hasProjectFiles = rootEntries.some(e => !['.git', '.maestro', '.claude'].includes(e));
+      const hasProjectFiles = rootEntries.some(e => !META_ENTRIES.has(e));
       if (!hasProjectFiles) {
         logDebug(LOG_PREFIX, 'Project directory empty (except meta) - treated as FRESH START. Skipping legacy session recovery.');
         return { sessionId: null, mainJsonl: null, subagentDir: null };
@@ -66,9 +125,10 @@ function getActiveSession(projectRoot) {
 
     // Find matching project directory (case-insensitive for Windows compatibility)
     const entries = fs.readdirSync(claudeProjectsDir);
+    const cwdLower = cwdNormalized.toLowerCase();
     // 1. Try exact match first
     for (const entry of entries) {
-      if (entry.toLowerCase() === cwdNormalized.toLowerCase()) {
+      if (entry.toLowerCase() === cwdLower) {
         projectDir = path.join(claudeProjectsDir, entry);
         break;
       }
@@ -78,7 +138,6 @@ function getActiveSession(projectRoot) {
     if (!projectDir) {
       for (const entry of entries) {
         const entryLower = entry.toLowerCase();
-        const cwdLower = cwdNormalized.toLowerCase();
         if (cwdLower && (entryLower.startsWith(cwdLower) || cwdLower.startsWith(entryLower))) {
           projectDir = path.join(claudeProjectsDir, entry);
           break;
@@ -91,17 +150,23 @@ function getActiveSession(projectRoot) {
     }
 
     // Try to find session from .jsonl files
-    const jsonlFiles = fs.readdirSync(projectDir)
-      .filter(f => f.endsWith('.jsonl'))
-      .map(f => ({
-        name: f,
-        path: path.join(projectDir, f),
-        mtime: fs.statSync(path.join(projectDir, f)).mtimeMs
-      }))
-      .sort((a, b) => b.mtime - a.mtime);
-
-    if (jsonlFiles.length > 0) {
-      const latestJsonl = jsonlFiles[0];
+    // Keep only the newest transcript; a file removed mid-scan is skipped
+    let latestJsonl = null;
+    for (const f of fs.readdirSync(projectDir)) {
+      if (!f.endsWith('.jsonl')) continue;
+      const filePath = path.join(projectDir, f);
+      let mtime;
+      try {
+        mtime = fs.statSync(filePath).mtimeMs;
+      } catch (err) {
+        continue;
+      }
+      if (!latestJsonl || mtime > latestJsonl.mtime) {
+        latestJsonl = { name: f, path: filePath, mtime };
+      }
+    }
+
+    if (latestJsonl) {
       const sessionId = latestJsonl.name.replace('.jsonl', '');
       const mainJsonl = latestJsonl.path;
       const subagentDir = path.join(projectDir, sessionId, 'subagents');
@@ -139,15 +204,47 @@ function getActiveSession(projectRoot) {
   }
 }
 
+// Read offsets are loaded once per run and written back once by
+// flushSyncState(), instead of a load/save round-trip per JSONL file.
+let syncStateCache = null;
+let syncStateDirty = false;
+
+/**
+ * Get the in-memory sync offset state (loaded on first use).
+ */
+function getSyncState() {
+  if (!syncStateCache) {
+    syncStateCache = loadState('sync', findProjectRoot()) || {};
+  }
+  return syncStateCache;
+}
+
+/**
+ * Persist sync offsets if any were updated since the last flush.
+ */
+function flushSyncState() {
+  if (syncStateCache && syncStateDirty) {
+    saveState('sync', syncStateCache, findProjectRoot());
+    syncStateDirty = false;
+  }
+}
+
 /**
  * Read JSONL file incrementally using offset tracking.
  */
 function readJsonlIncremental(filePath, sessionId, callback) {
-  const syncState = loadState('sync', findProjectRoot()) || {};
+  const syncState = getSyncState();
   const fileKey = `${sessionId}:${path.basename(filePath)}`;
   const startOffset = syncState[fileKey] || 0;
 
-  const stats = fs.statSync(filePath);
+  let stats;
+  try {
+    stats = fs.statSync(filePath);
+  } catch (err) {
+    logDebug(LOG_PREFIX, `Cannot stat ${fileKey}: ${err.message}`);
+    return Promise.resolve();
+  }
+
   if (stats.size < startOffset) {
     // File was rotated or cleared
     logDebug(LOG_PREFIX, `File ${fileKey} shrunk, resetting offset`);
@@ -187,9 +284,9 @@ function readJsonlIncremental(filePath, sessionId, callback) {
 
   fs.closeSync(fd);
 
-  // Save new offset
+  // Record new offset (persisted by flushSyncState)
   syncState[fileKey] = currentOffset;
-  saveState('sync', syncState, findProjectRoot());
+  syncStateDirty = true;
 
   return Promise.resolve();
 }
@@ -224,29 +321,13 @@ function processEntry(entry, data, toolIdToName = {}) {
           // Check non-error results for hidden errors (only for execution tools)
           if (blockType === 'tool_result' && !block.is_error) {
             const currentToolName = toolName || block.name || '';
-            if (!['run_command', 'browser_subagent', 'execute_python_code', 'Bash', 'Shell'].includes(currentToolName)) {
+            if (!EXECUTION_TOOLS.has(currentToolName)) {
               continue;
             }
 
             const resultContent = cleanAnsi(block.content || '');
-            const resultLower = resultContent.toLowerCase();
-
-            const errorKeywords = [
-              'exit code 127', 'exit code 1', 'exit code 2', 'exit code',
-              'command not found', 'bash: command not found',
-              'is not recognized as an internal or external command',
-              'is not recognized as the name of a cmdlet',
-              'failed to compile', 'build failed', 'compilation failed',
-              'error:', 'typeerror:', 'syntaxerror:',
-              'referenceerror:', 'cannot find module', 'module not found',
-              'command failed', 'npm err!', 'npm error',
-              'fatal:', 'exception:', 'traceback',
-              'no such file or directory', 'permission denied',
-              'access is denied', 'cannot find the path specified',
-              'error: exit code', 'error exit code'
-            ];
-
-            if (errorKeywords.some(kw => resultLower.includes(kw))) {
+
+            if (ERROR_KEYWORD_REGEX.test(resultContent)) {
               data.errors.push({
                 timestamp,
                 error: resultContent,
@@ -271,20 +352,8 @@ function processEntry(entry, data, toolIdToName = {}) {
           if (!text) continue;
 
           // Decisions
-          const decisionIndicators = [
-            'the user wants', 'user requested', 'requirements:',
-            'architecture:', 'design decision:', 'chosen approach:',
-            'will use', 'decided to', 'going with', 'selected',
-            'because', 'reason:', 'rationale:', 'plan:', 'strategy:'
-          ];
-          const skipIndicators = [
-            'Let me', 'Now let', "I will try", "I'll try",
-            'First,', 'Next,', 'Then,', 'Now I'
-          ];
-
-          const textLower = text.toLowerCase();
-          const isDecision = decisionIndicators.some(ind => textLower.includes(ind.toLowerCase()));
-          const isTransient = skipIndicators.some(skip => text.startsWith(skip));
+          const isDecision = DECISION_INDICATOR_REGEX.test(text);
+          const isTransient = SKIP_INDICATORS.some(skip => text.startsWith(skip));
 
           // NEW: Detect compact/session summaries
           // Check for explicit flag (most reliable) OR pattern matching
@@ -300,13 +369,12 @@ function processEntry(entry, data, toolIdToName = {}) {
           if (isSummary) {
             data.decisions.push({
               timestamp,
-              decision: `AUTO-SUMMARY: ${text.trim().replace(/\r\n/g, ' ').replace(/\n/g, ' ')}`
+              decision: `AUTO-SUMMARY: ${text.trim().replace(/\r?\n/g, ' ')}`
             });
           } else if (entryType === 'assistant' && isDecision && !isTransient && text.length > 30) {
-            const sentences = text.split(/[.!?]\s+/);
+            const sentences = text.split(SENTENCE_SPLIT_REGEX);
             for (const sentence of sentences) {
-              const sentLower = sentence.toLowerCase();
-              if (decisionIndicators.some(ind => sentLower.includes(ind.toLowerCase()))) {
+              if (DECISION_INDICATOR_REGEX.test(sentence)) {
                 if (sentence.trim().length > 20) {
                   data.decisions.push({
                     timestamp,
@@ -334,7 +402,7 @@ function processEntry(entry, data, toolIdToName = {}) {
           const toolInput = block.input || {};
 
           // File edits
-          if (['Edit', 'StrReplace', 'replace_file_content', 'multi_replace_file_content', 'search_replace'].includes(toolName)) {
+          if (EDIT_TOOLS.has(toolName)) {
             const filePath = toolInput.file_path || toolInput.path || toolInput.AbsolutePath || toolInput.TargetFile || '';
             if (filePath) {
               let relPath = filePath;
@@ -360,7 +428,7 @@ function processEntry(entry, data, toolIdToName = {}) {
           }
 
           // File writes/creates
-          if (['Write', 'write_to_file', 'write'].includes(toolName)) {
+          if (WRITE_TOOLS.has(toolName)) {
             const filePath = toolInput.file_path || toolInput.path || toolInput.AbsolutePath || '';
             if (filePath) {
               let relPath = filePath;
@@ -405,7 +473,7 @@ async function extractBrainData(sessionId, mainJsonl, subagentDir) {
 
   try {
     // 1. Process Main Session JSONL
-    if (mainJsonl && fs.existsSync(mainJsonl)) {
+    if (mainJsonl) {
       logDebug(LOG_PREFIX, `Extracting from main session: ${path.basename(mainJsonl)}`);
       await readJsonlIncremental(mainJsonl, sessionId, (entry) => {
         processEntry(entry, data, {}); // No toolIdToName for main yet
@@ -413,48 +481,58 @@ async function extractBrainData(sessionId, mainJsonl, subagentDir) {
     }
 
     // 2. Process Subagent JSONL
-    if (subagentDir && fs.existsSync(subagentDir)) {
-      const subFiles = fs.readdirSync(subagentDir)
-        .filter(f => f.endsWith('.jsonl'));
-
-      // First pass: Build tool ID to name map
-      const toolIdToName = {};
-      for (const subFile of subFiles) {
-        const subPath = path.join(subagentDir, subFile);
-        if (!fs.existsSync(subPath)) continue;
-
-        await readJsonlIncremental(subPath, sessionId, (entry) => {
-          if (entry.type === 'assistant') {
-            const msgContent = entry.message?.content || [];
-            if (Array.isArray(msgContent)) {
-              for (const block of msgContent) {
-                if (block.type === 'tool_use') {
-                  toolIdToName[block.id] = block.name;
-                }
+    // Missing files are skipped by readJsonlIncremental, so no per-file
+    // existsSync checks are needed here
+    let subFiles = [];
+    if (subagentDir) {
+      try {
+        subFiles = fs.readdirSync(subagentDir, { withFileTypes: true })
+          .filter(e => e.isFile() && e.name.endsWith('.jsonl'))
+          .map(e => e.name);
+      } catch (err) {
+        // No subagents directory for this session
+      }
+    }
+
+    // Single pass: tool_use blocks are indexed as they are read, so the
+    // tool_result entries that follow them resolve to a tool name. (A
+    // separate indexing pass would also consume the incremental offsets and
+    // leave nothing for extraction.)
+    const toolIdToName = {};
+    for (const subFile of subFiles) {
+      const subPath = path.join(subagentDir, subFile);
+
+      await readJsonlIncremental(subPath, sessionId, (entry) => {
+        if (entry.type === 'assistant') {
+          const msgContent = entry.message?.content || [];
+          if (Array.isArray(msgContent)) {
+            for (const block of msgContent) {
+              if (block.type === 'tool_use') {
+                toolIdToName[block.id] = block.name;
               }
             }
           }
-        });
-      }
-
-      // Second pass: Extract data
-      for (const subFile of subFiles) {
-        const subPath = path.join(subagentDir, subFile);
-        if (!fs.existsSync(subPath)) continue;
-
-        await readJsonlIncremental(subPath, sessionId, (entry) => {
-          processEntry(entry, data, toolIdToName);
-        });
-      }
+        }
+        processEntry(entry, data, toolIdToName);
+      });
     }
 
   } catch (err) {
     logDebug(LOG_PREFIX, `Extraction error: ${err.message}`);
   }
 
+  flushSyncState();
   return data;
 }
 
+/**
+ * Check whether extracted brain data contains anything to merge.
+ */
+function hasBrainData(data) {
+  return data.tasks.length > 0 || data.decisions.length > 0 || data.errors.length > 0 ||
+    data.fileChanges.length > 0 || data.thinking.length > 0;
+}
+
 /**
  * Compress verbose brain data into compact context summary.
  */
@@ -485,18 +563,21 @@ function compressToContext(data) {
       'news', 'blog', 'portfolio', 'ecommerce', 'app', 'tool', 'script'
     ];
 
-    const foundIndicators = [];
+    // Only the first 3 indicators are reported, so stop scanning once found
+    const foundIndicators = new Set();
     for (const t of thoughtsToCheck) {
       const thought = t.thought.toLowerCase();
       for (const ind of indicators) {
-        if (thought.includes(ind) && !foundIndicators.includes(ind)) {
-          foundIndicators.push(ind);
+        if (thought.includes(ind)) {
+          foundIndicators.add(ind);
+          if (foundIndicators.size === 3) break;
         }
       }
+      if (foundIndicators.size === 3) break;
     }
 
-    if (foundIndicators.length > 0) {
-      context.projectInfo = foundIndicators.slice(0, 3).join(' | ');
+    if (foundIndicators.size > 0) {
+      context.projectInfo = [...foundIndicators].join(' | ');
     }
   }
 
@@ -530,9 +611,10 @@ function compressToContext(data) {
     }
 
     let errKey = null;
+    const errLower = errText.toLowerCase();
 
     // TypeScript/ESLint errors
-    if (errText.toLowerCase().includes('error:')) {
+    if (errLower.includes('error:')) {
       for (const line of errText.split('\n')) {
         if (line.toLowerCase().includes('error') && line.includes(':')) {
           errKey = line.trim().substring(0, 500);
@@ -542,10 +624,10 @@ function compressToContext(data) {
     }
 
     // Exit code or command failures (including Windows bash errors)
-    if (!errKey && (errText.toLowerCase().includes('exit code') ||
-      errText.toLowerCase().includes('command not found') ||
-      errText.toLowerCase().includes('bash:') ||
-      errText.toLowerCase().includes('error: exit code'))) {
+    if (!errKey && (errLower.includes('exit code') ||
+      errLower.includes('command not found') ||
+      errLower.includes('bash:') ||
+      errLower.includes('error: exit code'))) {
       const lines = errText.split('\n').filter(l => l.trim());
       const junkPatterns = ['starting', 'running', 'inspecting', '...', '---'];
 
@@ -568,7 +650,7 @@ function compressToContext(data) {
     }
 
     // Build/compile errors
-    if (!errKey && errText.toLowerCase().includes('failed')) {
+    if (!errKey && errLower.includes('failed')) {
       errKey = errText.split('\n')[0]?.substring(0, 500);
     }
 
@@ -600,6 +682,25 @@ function compressToContext(data) {
   return context;
 }
 
+/**
+ * Merge new items into preserved brain entries, skipping duplicates.
+ * Existing contents are indexed in a Set so each item is an O(1) lookup
+ * rather than a scan of every preserved entry.
+ */
+function mergeUnique(existing, items, getContent, makeEntry) {
+  const merged = [...existing];
+  const seen = new Set(existing.map(getContent));
+
+  for (const item of items) {
+    if (!seen.has(item)) {
+      seen.add(item);
+      merged.push(makeEntry(item));
+    }
+  }
+
+  return merged;
+}
+
 /**
  * Write brain.jsonl with consolidated data.
  */
@@ -607,6 +708,8 @@ function writeBrainJsonl(sessionId, data, projectRoot) {
   try {
     const preserved = readPreservedBrain(projectRoot);
     const context = compressToContext(data);
+    // One timestamp per sync: all entries written by this run share it
+    const ts = getTimestamp();
 
     const entries = [];
 
@@ -614,7 +717,7 @@ function writeBrainJsonl(sessionId, data, projectRoot) {
     entries.push(...preserved.tech);
 
     // 2. Compact summaries (preserved + new, keep last 10)
-    const allCompactsRaw = [...preserved.compacts, ...context.compactSummaries.map(s => ({ type: 'compact', summary: s, ts: getTimestamp() }))];
+    const allCompactsRaw = [...preserved.compacts, ...context.compactSummaries.map(s => ({ type: 'compact', summary: s, ts }))];
     const uniqueCompacts = [];
     const seenCompacts = new Set();
     for (const e of allCompactsRaw) {
@@ -627,43 +730,39 @@ function writeBrainJsonl(sessionId, data, projectRoot) {
     entries.push(...uniqueCompacts.slice(-10));
 
     // 3. Goals (preserved + new)
-    const allGoalsRaw = [...preserved.goals];
-    if (context.projectInfo) {
-      const exists = allGoalsRaw.some(e => (e.content || '') === context.projectInfo);
-      if (!exists) {
-        allGoalsRaw.push({ type: 'goal', content: context.projectInfo, ts: getTimestamp() });
-      }
-    }
+    const allGoalsRaw = mergeUnique(
+      preserved.goals,
+      context.projectInfo ? [context.projectInfo] : [],
+      e => e.content || '',
+      content => ({ type: 'goal', content, ts })
+    );
     entries.push(...allGoalsRaw.slice(-20));
 
     // 4. Decisions (merged & deduplicated)
-    const allDecisionsRaw = [...preserved.decisions];
-    for (const dec of context.keyDecisions) {
-      const exists = allDecisionsRaw.some(e => (e.content || e.decision || '') === dec);
-      if (!exists) {
-        allDecisionsRaw.push({ type: 'decision', content: dec, session: sessionId });
-      }
-    }
+    const allDecisionsRaw = mergeUnique(
+      preserved.decisions,
+      context.keyDecisions,
+      e => e.content || e.decision || '',
+      content => ({ type: 'decision', content, session: sessionId })
+    );
     entries.push(...allDecisionsRaw.slice(-30));
 
     // 5. Completed items
-    const allCompletedRaw = [...preserved.completed];
-    for (const comp of context.completed) {
-      const exists = allCompletedRaw.some(e => (e.content || '') === comp);
-      if (!exists) {
-        allCompletedRaw.push({ type: 'completed', content: comp });
-      }
-    }
+    const allCompletedRaw = mergeUnique(
+      preserved.completed,
+      context.completed,
+      e => e.content || '',
+      content => ({ type: 'completed', content })
+    );
     entries.push(...allCompletedRaw.slice(-30));
 
     // 6. Errors/Blockers
-    const allErrorsRaw = [...preserved.errors];
-    for (const err of [...context.errors, ...context.blockers]) {
-      const exists = allErrorsRaw.some(e => (e.content || e.error || '') === err);
-      if (!exists) {
-        allErrorsRaw.push({ type: 'error', content: err });
-      }
-    }
+    const allErrorsRaw = mergeUnique(
+      preserved.errors,
+      [...context.errors, ...context.blockers],
+      e => e.content || e.error || '',
+      content => ({ type: 'error', content })
+    );
     entries.push(...allErrorsRaw.slice(-20));
 
     // 8. Others (preserve everything else)
@@ -715,23 +814,7 @@ function extractErrorsFromHookInput(hookInput) {
     const isError = toolResult.is_error || toolResult.isError ||
       hookInput.isError || false;
 
-    const contentLower = content.toLowerCase();
-    const errorKeywords = [
-      'exit code 127', 'exit code 1', 'exit code 2', 'exit code',
-      'command not found', 'bash: command not found',
-      'is not recognized as an internal or external command',
-      'is not recognized as the name of a cmdlet',
-      'failed to compile', 'build failed', 'compilation failed',
-      'error:', 'typeerror:', 'syntaxerror:',
-      'referenceerror:', 'cannot find module', 'module not found',
-      'command failed', 'npm err!', 'npm error',
-      'fatal:', 'exception:', 'traceback',
-      'no such file or directory', 'permission denied',
-      'access is denied', 'cannot find the path specified',
-      'error: exit code', 'error exit code'
-    ];
-
-    const hasError = isError || errorKeywords.some(kw => contentLower.includes(kw));
+    const hasError = isError || ERROR_KEYWORD_REGEX.test(content);
 
     if (hasError && content.length > 5) {
       errors.push({
@@ -750,7 +833,10 @@ function extractErrorsFromHookInput(hookInput) {
 }
 
 /**
- * Write errors directly to brain.jsonl (fallback when session not found).
+ * Append errors to brain.jsonl (fallback when session not found).
+ * New error lines are appended; only once the file holds more than the
+ * last 20 errors is it rewritten, so the fallback stays bounded even when
+ * no full sync (writeBrainJsonl) runs to trim it.
  */
 function writeErrorsToBrain(errors, projectRoot) {
   if (errors.length === 0) {
@@ -758,41 +844,39 @@ function writeErrorsToBrain(errors, projectRoot) {
   }
 
   try {
-    const preserved = readPreservedBrain(projectRoot);
-    const entries = [];
+    const entries = readBrain(projectRoot);
+    const existingErrors = entries.filter(e => e.type === 'error');
+    const knownErrors = new Set(existingErrors.map(e => e.content || e.error || ''));
+    const ts = getTimestamp();
+    const newErrors = [];
 
-    // Preserve tech entries
-    for (const techEntry of preserved.techEntries) {
-      entries.push(techEntry);
-    }
-
-    // Preserve existing errors
-    const existingErrors = preserved.errors || [];
-    const allErrors = [...existingErrors];
-
-    // Add new errors
     for (const err of errors) {
       const errText = err.error || '';
       const toolName = err.tool || '';
       const errorEntry = toolName ? `[${toolName}] ${errText}` : errText;
 
-      if (errText.length > 10 && !allErrors.includes(errorEntry)) {
-        allErrors.push(errorEntry);
+      if (errText.length > 10 && !knownErrors.has(errorEntry)) {
+        knownErrors.add(errorEntry);
+        newErrors.push({ type: 'error', content: errorEntry, ts });
       }
     }
 
-    // Keep last 20 errors
-    for (const err of allErrors.slice(-20)) {
-      entries.push({
-        type: 'error',
-        content: err,
-        ts: getTimestamp()
-      });
+    if (newErrors.length === 0) {
+      return;
     }
 
-    const { writeBrain } = require('./lib/brain');
-    writeBrain(entries, projectRoot);
-    logDebug(LOG_PREFIX, `Wrote ${errors.length} errors to brain.jsonl (fallback)`);
+    if (existingErrors.length + newErrors.length <= 20) {
+      for (const entry of newErrors) {
+        appendToBrain(entry, projectRoot);
+      }
+      logDebug(LOG_PREFIX, `Appended ${newErrors.length} errors to brain.jsonl (fallback)`);
+      return;
+    }
+
+    // Over the cap: rewrite once, keeping everything else and the last 20 errors
+    const keptErrors = [...existingErrors, ...newErrors].slice(-20);
+    writeBrain([...entries.filter(e => e.type !== 'error'), ...keptErrors], projectRoot);
+    logDebug(LOG_PREFIX, `Rewrote brain.jsonl keeping last ${keptErrors.length} errors (fallback)`);
 
   } catch (err) {
     logDebug(LOG_PREFIX, `Error writing errors: ${err.message}`);
@@ -824,22 +908,10 @@ async function main() {
     const immediateErrors = extractErrorsFromHookInput(hookInput);
     if (immediateErrors.length > 0) {
       logDebug(LOG_PREFIX, `Found ${immediateErrors.length} immediate errors`);
-      writeErrorsToBrain(immediateErrors, projectRoot);
     }
 
-    // Detect session
-    const { sessionId, mainJsonl, subagentDir } = getActiveSession(projectRoot);
-
-    if (!sessionId) {
-      // Even without session, we can write errors
-      if (immediateErrors.length > 0) {
-        logDebug(LOG_PREFIX, 'Session not found, but errors written');
-      }
-      outputJson({});
-      return;
-    }
-
-    // Throttling: 
+    // Throttling (checked before session detection, which scans the
+    // Claude projects directory and stats every transcript):
     // If no immediate errors and the last sync was very recent, consider skipping
     // to avoid excessive JSONL parsing on every tool use.
     // BYPASS throttling for critical events to ensure memory continuity.
@@ -854,6 +926,20 @@ async function main() {
       return;
     }
 
+    // Detect session
+    const { sessionId, mainJsonl, subagentDir } = getActiveSession(projectRoot);
+
+    if (!sessionId) {
+      // Even without session, we can write errors (with a session they are
+      // merged into the full sync below instead)
+      if (immediateErrors.length > 0) {
+        writeErrorsToBrain(immediateErrors, projectRoot);
+        logDebug(LOG_PREFIX, 'Session not found, but errors written');
+      }
+      outputJson({});
+      return;
+    }
+
     // Extract data from JSONL files
     // If this is a compaction/stop event, we might need to wait for Claude to flush the transcript
     let data;
@@ -874,8 +960,12 @@ async function main() {
       data.errors = [...immediateErrors, ...(data.errors || [])];
     }
 
-    // Write brain JSONL
-    writeBrainJsonl(sessionId, data, projectRoot);
+    // Write brain JSONL (nothing new since the last sync means nothing to merge)
+    if (hasBrainData(data)) {
+      writeBrainJsonl(sessionId, data, projectRoot);
+    } else {
+      logDebug(LOG_PREFIX, 'No new transcript data, skipping brain rewrite');
+    }
 
     // Save sync state
     saveState('brain-sync', { lastSync: now, lastSessionId: sessionId }, projectRoot);
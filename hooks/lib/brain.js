@@ -7,7 +7,7 @@
 
 const fs = require('fs');
 const path = require('path');
-const { getMaestroDir, ensureMaestroDir, getTimestamp, logDebug } = require('./utils');
+const { getMaestroDir, ensureMaestroDir, getTimestamp, stripBom, writeFileAtomic, logDebug } = require('./utils');
 
 const LOG_PREFIX = '[BRAIN]';
 
@@ -21,38 +21,84 @@ function getBrainPath(projectRoot = null) {
   return path.join(getMaestroDir(projectRoot), 'brain.jsonl');
 }
 
+// Last parsed brain.jsonl, reused while the file's mtime and size are unchanged
+let brainCache = null;
+
 /**
  * Read all entries from brain.jsonl.
  * 
+ * Parsed entries are memoized per process, keyed by path, mtime and size,
+ * so the several readers in one hook run parse the file only once.
+ * 
  * @param {string} [projectRoot] - Project root path
  * @returns {Array<object>} Array of brain entries
  */
 function readBrain(projectRoot = null) {
   const brainPath = getBrainPath(projectRoot);
-  const entries = [];
-
-  if (!fs.existsSync(brainPath)) {
-    return entries;
-  }
+  let entries = [];
 
   try {
-    const content = fs.readFileSync(brainPath, 'utf-8');
+    const stat = fs.statSync(brainPath);
+    if (brainCache && brainCache.path === brainPath &&
+      brainCache.mtimeMs === stat.mtimeMs && brainCache.size === stat.size) {
+      return brainCache.entries.slice();
+    }
+
+    const content = stripBom(fs.readFileSync(brainPath, 'utf-8'));
     const lines = content.split('\n').filter(line => line.trim());
 
-    for (const line of lines) {
-      try {
-        entries.push(JSON.parse(line));
-      } catch (err) {
-        logDebug(LOG_PREFIX, `Failed to parse line: ${line.substring(0, 50)}...`);
+    // Fast path: parse all lines in one JSON.parse call. Any malformed line
+    // (or a line that splits into several values) falls back to per-line
+    // parsing so only the bad lines are dropped.
+    let parsed = null;
+    try {
+      parsed = JSON.parse(`[${lines.join(',')}]`);
+    } catch (err) {
+      parsed = null;
+    }
+
+    if (parsed && parsed.length === lines.length) {
+      entries = parsed;
+    } else {
+      for (const line of lines) {
+        try {
+          entries.push(JSON.parse(line));
+        } catch (err) {
+          logDebug(LOG_PREFIX, `Failed to parse line: ${line.substring(0, 50)}...`);
+        }
       }
     }
+
+    brainCache = { path: brainPath, mtimeMs: stat.mtimeMs, size: stat.size, entries: entries.slice() };
   } catch (err) {
-    logDebug(LOG_PREFIX, `Error reading brain: ${err.message}`);
+    if (err.code !== 'ENOENT') {
+      logDebug(LOG_PREFIX, `Error reading brain: ${err.message}`);
+    }
   }
 
   return entries;
 }
 
+/**
+ * Check whether a file already holds exactly the given content.
+ * Compares byte size first so a differing file is usually rejected
+ * without being read.
+ * 
+ * @param {string} filePath - File to compare against
+ * @param {string} content - Content about to be written
+ * @returns {boolean} True if the write would be a no-op
+ */
+function isUnchanged(filePath, content) {
+  try {
+    if (fs.statSync(filePath).size !== Buffer.byteLength(content, 'utf-8')) {
+      return false;
+    }
+    return fs.readFileSync(filePath, 'utf-8') === content;
+  } catch (err) {
+    return false;
+  }
+}
+
 /**
  * Write entries to brain.jsonl (overwrites existing).
  * 
@@ -65,7 +111,12 @@ function writeBrain(entries, projectRoot = null) {
 
   try {
     const content = entries.map(e => JSON.stringify(e)).join('\n') + '\n';
-    fs.writeFileSync(brainPath, content, 'utf-8');
+    if (isUnchanged(brainPath, content)) {
+      logDebug(LOG_PREFIX, 'brain.jsonl unchanged, skipping write');
+      return;
+    }
+    brainCache = null;
+    writeFileAtomic(brainPath, content);
     logDebug(LOG_PREFIX, `Wrote ${entries.length} entries to brain.jsonl`);
   } catch (err) {
     logDebug(LOG_PREFIX, `Error writing brain: ${err.message}`);
@@ -83,6 +134,7 @@ function appendToBrain(entry, projectRoot = null) {
   const brainPath = path.join(maestroDir, 'brain.jsonl');
 
   try {
+    brainCache = null;
     fs.appendFileSync(brainPath, JSON.stringify(entry) + '\n', 'utf-8');
     logDebug(LOG_PREFIX, `Appended entry type=${entry.type} to brain.jsonl`);
   } catch (err) {
@@ -102,6 +154,18 @@ function readBrainByType(type, projectRoot = null) {
   return entries.filter(e => e.type === type);
 }
 
+// Entry type -> readPreservedBrain bucket; unknown types go to 'others'
+const PRESERVED_BUCKETS = {
+  tech_stack: 'tech',
+  architecture: 'tech',
+  scripts: 'tech',
+  compact: 'compacts',
+  error: 'errors',
+  decision: 'decisions',
+  completed: 'completed',
+  goal: 'goals'
+};
+
 /**
  * Read preserved data from brain.jsonl.
  * Preserves tech_stack, architecture, scripts, and compact entries.
@@ -123,23 +187,8 @@ function readPreservedBrain(projectRoot = null) {
   const entries = readBrain(projectRoot);
 
   for (const entry of entries) {
-    const type = entry.type;
-
-    if (['tech_stack', 'architecture', 'scripts'].includes(type)) {
-      preserved.tech.push(entry);
-    } else if (type === 'compact') {
-      preserved.compacts.push(entry);
-    } else if (type === 'error') {
-      preserved.errors.push(entry);
-    } else if (type === 'decision') {
-      preserved.decisions.push(entry);
-    } else if (type === 'completed') {
-      preserved.completed.push(entry);
-    } else if (type === 'goal') {
-      preserved.goals.push(entry);
-    } else {
-      preserved.others.push(entry);
-    }
+    const bucket = Object.hasOwn(PRESERVED_BUCKETS, entry.type) ? PRESERVED_BUCKETS[entry.type] : 'others';
+    preserved[bucket].push(entry);
   }
 
   return preserved;
@@ -353,6 +402,57 @@ function dedupe(arr) {
   return [...new Set(arr)];
 }
 
+/**
+ * Yield the non-empty lines of a file from last to first.
+ * The file is read in fixed-size chunks starting at the end, so a scan that
+ * stops near the end never reads, decodes or splits the rest of the file.
+ * 
+ * @param {string} filePath - Path to file
+ * @param {number} [chunkSize=65536] - Bytes read per step
+ * @yields {string} Decoded line
+ */
+function* readLinesReverse(filePath, chunkSize = 64 * 1024) {
+  const fd = fs.openSync(filePath, 'r');
+  try {
+    let position = fs.fstatSync(fd).size;
+    // Bytes of a line that started in an earlier (not yet read) chunk
+    let tailParts = [];
+
+    while (position > 0) {
+      const size = Math.min(chunkSize, position);
+      position -= size;
+      const chunk = Buffer.allocUnsafe(size);
+      fs.readSync(fd, chunk, 0, size, position);
+
+      let end = size;
+      while (end > 0) {
+        const newline = chunk.lastIndexOf(0x0a, end - 1);
+        if (newline === -1) break;
+
+        const line = tailParts.length > 0
+          ? Buffer.concat([chunk.subarray(newline + 1, end), ...tailParts]).toString('utf-8')
+          : chunk.toString('utf-8', newline + 1, end);
+        tailParts = [];
+        end = newline;
+        if (line.trim()) {
+          yield line;
+        }
+      }
+
+      if (end > 0) {
+        tailParts.unshift(chunk.subarray(0, end));
+      }
+    }
+
+    const first = Buffer.concat(tailParts).toString('utf-8');
+    if (first.trim()) {
+      yield first;
+    }
+  } finally {
+    fs.closeSync(fd);
+  }
+}
+
 /**
  * Extract the last assistant message (likely the compact summary) from a transcript.
  * 
@@ -372,15 +472,12 @@ function extractLastSummary(transcriptPath) {
       return null;
     }
 
-    const content = fs.readFileSync(transcriptPath, 'utf-8');
-    const lines = content.split('\n').filter(l => l.trim());
-
     let lastAssistantMessage = null;
 
     // Read backwards to find last message that looks like a summary
-    for (let i = lines.length - 1; i >= 0; i--) {
+    for (const line of readLinesReverse(transcriptPath)) {
       try {
-        const entry = JSON.parse(lines[i]);
+        const entry = JSON.parse(line);
 
         // DETECTION 1: Explicit flag (The most reliable way in new Claude Code versions)
         if (entry.isCompactSummary || entry.is_compact_summary) {
@@ -16,6 +16,9 @@ const path = require('path');
 const {
   findProjectRoot,
   getMaestroDir,
+  stringifyState,
+  stripBom,
+  writeFileAtomic,
   logDebug
 } = require('./utils');
 
@@ -68,15 +71,14 @@ function getActiveFilePath() {
  */
 function readState() {
   const statePath = getStateFilePath();
-  if (!fs.existsSync(statePath)) {
-    return null;
-  }
 
   try {
     const content = fs.readFileSync(statePath, 'utf8');
-    return JSON.parse(content);
+    return JSON.parse(stripBom(content));
   } catch (err) {
-    logDebug(LOG_PREFIX, `Error reading state: ${err.message}`);
+    if (err.code !== 'ENOENT') {
+      logDebug(LOG_PREFIX, `Error reading state: ${err.message}`);
+    }
     return null;
   }
 }
@@ -95,7 +97,7 @@ function writeState(state) {
   }
 
   state.lastUpdate = Date.now();
-  fs.writeFileSync(statePath, JSON.stringify(state, null, 2));
+  writeFileAtomic(statePath, stringifyState(state));
   logDebug(LOG_PREFIX, `State updated: ${state.current}/${state.max}`);
 }
 
@@ -9,6 +9,8 @@ const fs = require('fs');
 const path = require('path');
 const os = require('os');
 
+const projectRootCache = new Map();
+
 /**
  * Find the project root directory.
  * 
@@ -17,10 +19,29 @@ const os = require('os');
  * 2. CLAUDE_WORKING_DIR environment variable (fallback)
  * 3. Search upward from current directory for root markers
  * 
+ * The result is memoized per start directory for the life of the process;
+ * hooks call this from many helpers and the answer cannot change mid-run.
+ * 
  * @param {string} [startDir] - Starting directory for search
  * @returns {string} Project root path
  */
 function findProjectRoot(startDir = null) {
+  const key = startDir || process.cwd();
+  let root = projectRootCache.get(key);
+  if (root === undefined) {
+    root = resolveProjectRoot(startDir);
+    projectRootCache.set(key, root);
+  }
+  return root;
+}
+
+/**
+ * Uncached project root lookup used by findProjectRoot.
+ * 
+ * @param {string} [startDir] - Starting directory for search
+ * @returns {string} Project root path
+ */
+function resolveProjectRoot(startDir) {
   // Priority 1: Use CLAUDE_PROJECT_DIR if set by Claude Code
   const claudeProjectDir = process.env.CLAUDE_PROJECT_DIR;
   if (claudeProjectDir && fs.existsSync(claudeProjectDir)) {
@@ -117,6 +138,9 @@ function getClaudeProjectsDir() {
   return path.join(os.homedir(), '.claude', 'projects');
 }
 
+// Slashes and dots, all mapped to '-' in one replace pass
+const PATH_SEPARATOR_REGEX = /[\\/.]/g;
+
 /**
  * Normalize a project path for Claude's folder naming convention.
  * Claude Code normalizes paths: C:\Users\foo -> C--Users-foo
@@ -130,23 +154,28 @@ function normalizeProjectPath(rawPath) {
     // Force drive letter to uppercase for consistent matching
     drive = drive.toUpperCase();
     // Remove leading slashes and replace all slashes/dots with dashes
-    const normalized = rest.replace(/^[\\/]+/, '').replace(/[\\/]/g, '-').replace(/\./g, '-');
+    const normalized = rest.replace(/^[\\/]+/, '').replace(PATH_SEPARATOR_REGEX, '-');
     return `${drive}--${normalized}`;
   }
-  return rawPath.replace(/[\\/]/g, '-').replace(/\./g, '-');
+  return rawPath.replace(PATH_SEPARATOR_REGEX, '-');
 }
 
+// Debug flag, read once at load
+const DEBUG = process.env.MAESTRO_DEBUG === '1';
+
 /**
  * Log message to stderr (for debugging).
  * Only logs when MAESTRO_DEBUG=1
  * 
+ * Lines are written as they are logged (not buffered) so output survives
+ * a hook that is killed on timeout.
+ * 
  * @param {string} prefix - Log prefix (e.g., '[BRAIN]')
  * @param {string} msg - Message to log
  */
 function logDebug(prefix, msg) {
-  if (process.env.MAESTRO_DEBUG === '1') {
-    process.stderr.write(`${prefix} ${msg}\n`);
-  }
+  if (!DEBUG) return;
+  process.stderr.write(`${prefix} ${msg}\n`);
 }
 
 /**
@@ -173,6 +202,26 @@ function readFileSafe(filePath, maxSize = 100000) {
   }
 }
 
+/**
+ * Strip a leading UTF-8 byte order mark (JSON.parse rejects it).
+ * 
+ * @param {string} text - Decoded file contents
+ * @returns {string} Text without BOM
+ */
+function stripBom(text) {
+  return text.charCodeAt(0) === 0xFEFF ? text.slice(1) : text;
+}
+
+/**
+ * Escape regex metacharacters so text matches literally inside a RegExp.
+ * 
+ * @param {string} text - Literal text
+ * @returns {string} Escaped pattern source
+ */
+function escapeRegExp(text) {
+  return text.replace(/[.*+?^${}()|[\]\\]/g, '\\$&');
+}
+
 /**
  * Remove ANSI escape codes from text.
  * 
@@ -180,6 +229,10 @@ function readFileSafe(filePath, maxSize = 100000) {
  * @returns {string} Clean text
  */
 function cleanAnsi(text) {
+  // Most tool output has no escape codes; skip the regex when ESC is absent
+  if (typeof text === 'string' && !text.includes('\x1B')) {
+    return text;
+  }
   // ANSI escape code pattern
   return text.replace(/\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])/g, '');
 }
@@ -280,26 +333,6 @@ function simpleHash(content) {
   return crypto.createHash('md5').update(content).digest('hex');
 }
 
-/**
- * Get file hash for change detection.
- * 
- * @param {string} filePath - Path to file
- * @returns {string|null} File hash or null if failed
- */
-function getFileHash(filePath) {
-  try {
-    if (!fs.existsSync(filePath)) {
-      return null;
-    }
-    const content = fs.readFileSync(filePath);
-    return simpleHash(content.toString());
-  } catch (err) {
-    return null;
-  }
-}
-
-const { execSync } = require('child_process');
-
 /**
  * Check if the current project is a Git repository.
  * 
@@ -322,6 +355,7 @@ function isGitProject(projectRoot) {
  */
 function getGitDirtyFiles(projectRoot) {
   try {
+    const { execSync } = require('child_process');
     // --porcelain=v1 gives a predictable, machine-readable output
     const output = execSync('git status --porcelain=v1', { cwd: projectRoot, encoding: 'utf-8' });
     return output.split('\n')
@@ -333,6 +367,42 @@ function getGitDirtyFiles(projectRoot) {
   }
 }
 
+/**
+ * Serialize state data to JSON.
+ * Compact by default (state files are rewritten on every hook run);
+ * pretty-printed when MAESTRO_DEBUG=1 so the files stay easy to inspect.
+ * 
+ * @param {object} data - Data to serialize
+ * @returns {string} JSON string
+ */
+function stringifyState(data) {
+  return DEBUG
+    ? JSON.stringify(data, null, 2)
+    : JSON.stringify(data);
+}
+
+/**
+ * Write a file atomically: write a sibling temp file, then rename it over
+ * the target so readers never observe a truncated file.
+ * 
+ * @param {string} filePath - Destination path
+ * @param {string} content - File content
+ */
+function writeFileAtomic(filePath, content) {
+  const tmpPath = `${filePath}.${process.pid}.tmp`;
+  try {
+    fs.writeFileSync(tmpPath, content, 'utf-8');
+    fs.renameSync(tmpPath, filePath);
+  } catch (err) {
+    try {
+      fs.unlinkSync(tmpPath);
+    } catch (cleanupErr) {
+      // Ignore
+    }
+    throw err;
+  }
+}
+
 /**
  * Save state to .maestro directory.
  * 
@@ -344,7 +414,7 @@ function saveState(name, data, projectRoot = null) {
   try {
     const maestroDir = ensureMaestroDir(projectRoot);
     const stateFile = path.join(maestroDir, `${name}.state`);
-    fs.writeFileSync(stateFile, JSON.stringify(data, null, 2), 'utf-8');
+    writeFileAtomic(stateFile, stringifyState(data));
   } catch (err) {
     logDebug('[UTILS]', `Error saving state ${name}: ${err.message}`);
   }
@@ -361,15 +431,27 @@ function loadState(name, projectRoot = null) {
   try {
     const maestroDir = getMaestroDir(projectRoot);
     const stateFile = path.join(maestroDir, `${name}.state`);
-    if (fs.existsSync(stateFile)) {
-      return JSON.parse(fs.readFileSync(stateFile, 'utf-8'));
-    }
+    return JSON.parse(stripBom(fs.readFileSync(stateFile, 'utf-8')));
   } catch (err) {
-    logDebug('[UTILS]', `Error loading state ${name}: ${err.message}`);
+    if (err.code !== 'ENOENT') {
+      logDebug('[UTILS]', `Error loading state ${name}: ${err.message}`);
+    }
   }
   return null;
 }
 
+// Tools that do not change project state
+const READ_ONLY_TOOLS = new Set([
+  'view_file', 'Read', 'read_file',
+  'list_dir', 'LS', 'ls', 'dir',
+  'grep_search', 'Grep', 'search',
+  'find_by_name', 'Glob', 'glob',
+  'read_url_content', 'read_browser_page',
+  'list_resources', 'read_resource',
+  'command_status', 'read_terminal',
+  'AskUserQuestion', 'ask'
+]);
+
 /**
  * Check if a tool is read-only (unlikely to change project state).
  * 
@@ -377,17 +459,7 @@ function loadState(name, projectRoot = null) {
  * @returns {boolean} True if read-only
  */
 function isReadOnlyTool(toolName) {
-  const readOnlyTools = [
-    'view_file', 'Read', 'read_file',
-    'list_dir', 'LS', 'ls', 'dir',
-    'grep_search', 'Grep', 'search',
-    'find_by_name', 'Glob', 'glob',
-    'read_url_content', 'read_browser_page',
-    'list_resources', 'read_resource',
-    'command_status', 'read_terminal',
-    'AskUserQuestion', 'ask'
-  ];
-  return readOnlyTools.includes(toolName);
+  return READ_ONLY_TOOLS.has(toolName);
 }
 
 module.exports = {
@@ -398,18 +470,21 @@ module.exports = {
   getClaudeProjectsDir,
   isGitProject,
   getGitDirtyFiles,
+  stringifyState,
+  writeFileAtomic,
   saveState,
   loadState,
   isReadOnlyTool,
   normalizeProjectPath,
   logDebug,
   readFileSafe,
+  stripBom,
+  escapeRegExp,
   cleanAnsi,
   getTimestamp,
   getTimeOnly,
   readStdin,
   outputJson,
   truncateSmart,
-  simpleHash,
-  getFileHash
+  simpleHash
 };
@@ -50,8 +50,9 @@ function getCurrentTranscript() {
 
     // Find matching project directory (case-insensitive for Windows compatibility)
     const entries = fs.readdirSync(claudeProjectsDir);
+    const cwdLower = cwdNormalized.toLowerCase();
     for (const entry of entries) {
-      if (entry.toLowerCase() === cwdNormalized.toLowerCase()) {
+      if (entry.toLowerCase() === cwdLower) {
         projectDir = path.join(claudeProjectsDir, entry);
         break;
       }
@@ -61,7 +62,6 @@ function getCurrentTranscript() {
     if (!projectDir) {
       for (const entry of entries) {
         const entryLower = entry.toLowerCase();
-        const cwdLower = cwdNormalized.toLowerCase();
         if (cwdLower && (entryLower.startsWith(cwdLower) || cwdLower.startsWith(entryLower))) {
           projectDir = path.join(claudeProjectsDir, entry);
           break;
@@ -73,21 +73,22 @@ function getCurrentTranscript() {
       return null;
     }
 
-    // Find most recent JSONL file
-    const jsonlFiles = fs.readdirSync(projectDir)
-      .filter(f => f.endsWith('.jsonl'))
-      .map(f => ({
-        name: f,
-        path: path.join(projectDir, f),
-        mtime: fs.statSync(path.join(projectDir, f)).mtimeMs
-      }))
-      .sort((a, b) => b.mtime - a.mtime);
-
-    if (jsonlFiles.length > 0) {
-      return jsonlFiles[0].path;
+    // Find most recent JSONL file in a single pass
+    let latestPath = null;
+    let latestMtime = -Infinity;
+    for (const f of fs.readdirSync(projectDir)) {
+      if (!f.endsWith('.jsonl')) {
+        continue;
+      }
+      const filePath = path.join(projectDir, f);
+      const mtime = fs.statSync(filePath).mtimeMs;
+      if (mtime > latestMtime) {
+        latestMtime = mtime;
+        latestPath = filePath;
+      }
     }
 
-    return null;
+    return latestPath;
   } catch (err) {
     logDebug(LOG_PREFIX, `Error finding transcript: ${err.message}`);
     return null;
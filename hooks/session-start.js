@@ -13,8 +13,10 @@ const {
   findProjectRoot,
   getMaestroDir,
   ensureMaestroDir,
+  loadState,
+  saveState,
   readFileSafe,
-  getFileHash,
+  simpleHash,
   readStdin,
   logDebug,
   outputJson
@@ -29,6 +31,12 @@ const {
 
 const LOG_PREFIX = '[SESSION-START]';
 
+// Root entries that do not count as project files
+const META_ENTRIES = new Set(['.git', '.maestro', '.claude']);
+
+// Semver range operators stripped from dependency versions
+const VERSION_RANGE_REGEX = /[\^~>=<]/g;
+
 // Framework detection patterns
 const FRAMEWORK_PATTERNS = {
   'next.js': { deps: ['next'], files: ['next.config.js', 'next.config.mjs', 'next.config.ts'] },
@@ -105,14 +113,74 @@ const IMPORTANT_DEPS = {
   'framer-motion': 'Animation (Framer)'
 };
 
+// Default filesystems on Windows and macOS are case-insensitive, so names
+// are folded there to match what existsSync would report
+const CASE_INSENSITIVE_FS = process.platform === 'win32' || process.platform === 'darwin';
+
+/**
+ * Create a cached existence check for paths relative to the project root.
+ * Each directory is read once with readdir and its entry names kept in a Set,
+ * so probing dozens of marker files costs one syscall per directory instead
+ * of one existsSync per candidate.
+ */
+function createPathLookup(projectRoot) {
+  const dirNames = new Map();
+  const fold = name => (CASE_INSENSITIVE_FS ? name.toLowerCase() : name);
+
+  return function has(relPath) {
+    const dir = fold(path.dirname(relPath));
+    if (!dirNames.has(dir)) {
+      let names;
+      try {
+        names = new Set(fs.readdirSync(path.join(projectRoot, dir)).map(fold));
+      } catch (err) {
+        names = new Set();
+      }
+      dirNames.set(dir, names);
+    }
+    return dirNames.get(dir).has(fold(path.basename(relPath)));
+  };
+}
+
+/**
+ * Read package.json once for hashing and analysis.
+ */
+function readPackageJson(projectRoot) {
+  try {
+    return fs.readFileSync(path.join(projectRoot, 'package.json'), 'utf-8');
+  } catch (err) {
+    return null; // No package.json
+  }
+}
+
+/**
+ * Get the package.json stat signature (mtime + size) used by the tech cache.
+ */
+function getPackageJsonStat(projectRoot) {
+  try {
+    const stats = fs.statSync(path.join(projectRoot, 'package.json'));
+    return { mtimeMs: stats.mtimeMs, size: stats.size };
+  } catch (err) {
+    return null;
+  }
+}
+
+/**
+ * Check whether package.json is untouched since it was last checked.
+ * A stat match skips reading and hashing package.json entirely.
+ */
+function isTechCacheFresh(projectRoot, pkgStat) {
+  const cached = loadState('tech-cache', projectRoot);
+  return Boolean(pkgStat && cached &&
+    cached.mtimeMs === pkgStat.mtimeMs && cached.size === pkgStat.size);
+}
+
 /**
  * Check if tech stack needs re-analysis (package.json changed).
  */
-function shouldReanalyzeTech(projectRoot) {
-  const pkgPath = path.join(projectRoot, 'package.json');
+function shouldReanalyzeTech(projectRoot, currentHash) {
   const hashFile = path.join(getMaestroDir(projectRoot), '.tech_hash');
 
-  const currentHash = getFileHash(pkgPath);
   if (!currentHash) {
     return false; // No package.json
   }
@@ -134,11 +202,9 @@ function shouldReanalyzeTech(projectRoot) {
 /**
  * Save current package.json hash.
  */
-function saveTechHash(projectRoot) {
-  const pkgPath = path.join(projectRoot, 'package.json');
+function saveTechHash(projectRoot, hash) {
   const hashFile = path.join(ensureMaestroDir(projectRoot), '.tech_hash');
 
-  const hash = getFileHash(pkgPath);
   if (hash) {
     try {
       fs.writeFileSync(hashFile, hash, 'utf-8');
@@ -151,16 +217,13 @@ function saveTechHash(projectRoot) {
 /**
  * Analyze package.json and extract tech stack info.
  */
-function analyzePackageJson(projectRoot) {
-  const pkgPath = path.join(projectRoot, 'package.json');
-
-  if (!fs.existsSync(pkgPath)) {
+function analyzePackageJson(projectRoot, pkgContent, has = createPathLookup(projectRoot)) {
+  if (pkgContent === null) {
     logDebug(LOG_PREFIX, 'No package.json found');
     return null;
   }
 
   try {
-    const pkgContent = fs.readFileSync(pkgPath, 'utf-8');
     const pkg = JSON.parse(pkgContent);
 
     const result = {
@@ -192,7 +255,7 @@ function analyzePackageJson(projectRoot) {
             result.frameworks.push(framework);
           }
           // Capture version
-          const version = allDeps[dep].replace(/[\^~>=<]/g, '');
+          const version = allDeps[dep].replace(VERSION_RANGE_REGEX, '');
           result.frameworkVersions[dep] = version;
           break;
         }
@@ -200,7 +263,7 @@ function analyzePackageJson(projectRoot) {
 
       // Check config files
       for (const cfgFile of patterns.files) {
-        if (fs.existsSync(path.join(projectRoot, cfgFile))) {
+        if (has(cfgFile)) {
           if (!result.frameworks.includes(framework)) {
             result.frameworks.push(framework);
           }
@@ -211,17 +274,17 @@ function analyzePackageJson(projectRoot) {
 
     // Always capture React version if present
     if (allDeps['react'] && !result.frameworkVersions['react']) {
-      result.frameworkVersions['react'] = allDeps['react'].replace(/[\^~>=<]/g, '');
+      result.frameworkVersions['react'] = allDeps['react'].replace(VERSION_RANGE_REGEX, '');
     }
 
     // Capture TypeScript version
     if (allDeps['typescript']) {
-      result.frameworkVersions['typescript'] = allDeps['typescript'].replace(/[\^~>=<]/g, '');
+      result.frameworkVersions['typescript'] = allDeps['typescript'].replace(VERSION_RANGE_REGEX, '');
     }
 
     // Capture Tailwind version
     if (allDeps['tailwindcss']) {
-      result.frameworkVersions['tailwindcss'] = allDeps['tailwindcss'].replace(/[\^~>=<]/g, '');
+      result.frameworkVersions['tailwindcss'] = allDeps['tailwindcss'].replace(VERSION_RANGE_REGEX, '');
     }
 
     // Detect important dependencies
@@ -237,7 +300,7 @@ function analyzePackageJson(projectRoot) {
 
       // Check tsconfig for strict mode
       const tsconfigPath = path.join(projectRoot, 'tsconfig.json');
-      if (fs.existsSync(tsconfigPath)) {
+      if (has('tsconfig.json')) {
         try {
           const tsconfig = JSON.parse(fs.readFileSync(tsconfigPath, 'utf-8'));
           if (tsconfig.compilerOptions?.strict) {
@@ -250,12 +313,12 @@ function analyzePackageJson(projectRoot) {
     }
 
     // ESLint
-    if (allDeps['eslint'] || fs.existsSync(path.join(projectRoot, '.eslintrc.js'))) {
+    if (allDeps['eslint'] || has('.eslintrc.js')) {
       result.devTools.push('ESLint');
     }
 
     // Prettier
-    if (allDeps['prettier'] || fs.existsSync(path.join(projectRoot, '.prettierrc'))) {
+    if (allDeps['prettier'] || has('.prettierrc')) {
       result.devTools.push('Prettier');
     }
 
@@ -274,13 +337,13 @@ function analyzePackageJson(projectRoot) {
     }
 
     // Package manager detection
-    if (fs.existsSync(path.join(projectRoot, 'pnpm-lock.yaml'))) {
+    if (has('pnpm-lock.yaml')) {
       result.packageManager = 'pnpm';
-    } else if (fs.existsSync(path.join(projectRoot, 'yarn.lock'))) {
+    } else if (has('yarn.lock')) {
       result.packageManager = 'yarn';
-    } else if (fs.existsSync(path.join(projectRoot, 'package-lock.json'))) {
+    } else if (has('package-lock.json')) {
       result.packageManager = 'npm';
-    } else if (fs.existsSync(path.join(projectRoot, 'bun.lockb'))) {
+    } else if (has('bun.lockb')) {
       result.packageManager = 'bun';
     }
 
@@ -296,7 +359,7 @@ function analyzePackageJson(projectRoot) {
 /**
  * Analyze project directory structure.
  */
-function analyzeProjectStructure(projectRoot) {
+function analyzeProjectStructure(projectRoot, has = createPathLookup(projectRoot)) {
   const structure = {
     type: 'unknown',
     patterns: [],
@@ -305,56 +368,51 @@ function analyzeProjectStructure(projectRoot) {
   };
 
   // Check for common patterns
-  if (fs.existsSync(path.join(projectRoot, 'app'))) {
+  if (has('app')) {
     structure.patterns.push('App Router (Next.js 13+)');
     structure.keyDirectories.push('app/');
   }
 
-  if (fs.existsSync(path.join(projectRoot, 'pages'))) {
+  if (has('pages')) {
     structure.patterns.push('Pages Router');
     structure.keyDirectories.push('pages/');
   }
 
-  if (fs.existsSync(path.join(projectRoot, 'src'))) {
+  if (has('src')) {
     structure.keyDirectories.push('src/');
 
     // Check src subdirectories
     const srcSubdirs = ['components', 'hooks', 'lib', 'utils', 'services', 'api', 'store', 'types', 'styles'];
     for (const subdir of srcSubdirs) {
-      if (fs.existsSync(path.join(projectRoot, 'src', subdir))) {
+      if (has(`src/${subdir}`)) {
         structure.keyDirectories.push(`src/${subdir}/`);
       }
     }
   }
 
-  if (fs.existsSync(path.join(projectRoot, 'components'))) {
+  if (has('components')) {
     structure.keyDirectories.push('components/');
   }
 
-  if (fs.existsSync(path.join(projectRoot, 'lib'))) {
+  if (has('lib')) {
     structure.keyDirectories.push('lib/');
   }
 
-  if (fs.existsSync(path.join(projectRoot, 'public'))) {
+  if (has('public')) {
     structure.keyDirectories.push('public/');
   }
 
   // API routes
-  const apiPaths = [
-    path.join(projectRoot, 'app', 'api'),
-    path.join(projectRoot, 'pages', 'api'),
-    path.join(projectRoot, 'src', 'app', 'api')
-  ];
+  const apiPaths = ['app/api', 'pages/api', 'src/app/api'];
   for (const apiPath of apiPaths) {
-    if (fs.existsSync(apiPath)) {
+    if (has(apiPath)) {
       structure.patterns.push('API Routes');
       break;
     }
   }
 
   // Monorepo detection
-  if (fs.existsSync(path.join(projectRoot, 'packages')) ||
-    fs.existsSync(path.join(projectRoot, 'apps'))) {
+  if (has('packages') || has('apps')) {
     structure.type = 'monorepo';
     structure.patterns.push('Monorepo');
   } else {
@@ -362,8 +420,7 @@ function analyzeProjectStructure(projectRoot) {
   }
 
   // Docker
-  if (fs.existsSync(path.join(projectRoot, 'Dockerfile')) ||
-    fs.existsSync(path.join(projectRoot, 'docker-compose.yml'))) {
+  if (has('Dockerfile') || has('docker-compose.yml')) {
     structure.patterns.push('Docker');
   }
 
@@ -374,7 +431,7 @@ function analyzeProjectStructure(projectRoot) {
     'index.ts', 'index.js'
   ];
   for (const entry of entryFiles) {
-    if (fs.existsSync(path.join(projectRoot, entry))) {
+    if (has(entry)) {
       structure.entryPoints.push(entry);
     }
   }
@@ -490,7 +547,7 @@ async function main() {
 
     // STALE CONTEXT GUARD: Detect if project is empty (Treat as Black Slate)
     const rootEntries = fs.readdirSync(projectRoot);
-    const hasProjectFiles = rootEntries.some(e => !['.git', '.maestro', '.claude'].includes(e));
+    const hasProjectFiles = rootEntries.some(e => !META_ENTRIES.has(e));
     if (!hasProjectFiles) {
       logDebug(LOG_PREFIX, 'Project directory empty (except meta) - treated as BLACK SLATE.');
 
@@ -525,18 +582,32 @@ Existing project memory has been PURGED to prevent stale context retrieval.
     }
 
     // 1. Analyze tech stack if needed (package.json changed or first run)
-    if (shouldReanalyzeTech(projectRoot)) {
-      logDebug(LOG_PREFIX, 'Tech stack analysis triggered');
-      const techInfo = analyzePackageJson(projectRoot);
-      const structure = analyzeProjectStructure(projectRoot);
-
-      if (techInfo) {
-        writeTechToBrain(techInfo, structure, projectRoot);
-        saveTechHash(projectRoot);
-        logDebug(LOG_PREFIX, 'Tech stack info written to brain.jsonl');
-      }
+    const pkgStat = getPackageJsonStat(projectRoot);
+
+    if (isTechCacheFresh(projectRoot, pkgStat)) {
+      logDebug(LOG_PREFIX, 'package.json untouched (mtime/size), skipping tech analysis');
     } else {
-      logDebug(LOG_PREFIX, 'Tech stack already analyzed, skipping');
+      const pkgContent = readPackageJson(projectRoot);
+      const techHash = pkgContent !== null ? simpleHash(pkgContent) : null;
+
+      if (shouldReanalyzeTech(projectRoot, techHash)) {
+        logDebug(LOG_PREFIX, 'Tech stack analysis triggered');
+        const has = createPathLookup(projectRoot);
+        const techInfo = analyzePackageJson(projectRoot, pkgContent, has);
+        const structure = analyzeProjectStructure(projectRoot, has);
+
+        if (techInfo) {
+          writeTechToBrain(techInfo, structure, projectRoot);
+          saveTechHash(projectRoot, techHash);
+          saveState('tech-cache', pkgStat, projectRoot);
+          logDebug(LOG_PREFIX, 'Tech stack info written to brain.jsonl');
+        }
+      } else {
+        logDebug(LOG_PREFIX, 'Tech stack already analyzed, skipping');
+        if (pkgStat) {
+          saveState('tech-cache', pkgStat, projectRoot);
+        }
+      }
     }
 
     // 2. Build context from LTM (brain.jsonl) and Plans
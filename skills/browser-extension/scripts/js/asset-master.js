@@ -11,23 +11,27 @@
 const fs = require('fs');
 const path = require('path');
 
+// Directories that never hold extension assets
+const SKIP_DIRS = new Set(['node_modules', '.git']);
+
+// Asset extensions that are audited
+const ASSET_EXTENSIONS = new Set(['.png', '.jpg', '.jpeg', '.svg']);
+
 /**
- * Recursively find all files in a directory.
+ * Recursively find asset files in a directory.
+ * Uses dirent types so only matching assets are ever stat'ed, and skips
+ * dependency/VCS directories instead of descending into them.
  */
 function walkDir(dir, fileList = []) {
   try {
-    const files = fs.readdirSync(dir);
-    for (const file of files) {
-      const filePath = path.join(dir, file);
-      try {
-        const stat = fs.statSync(filePath);
-        if (stat.isDirectory()) {
-          walkDir(filePath, fileList);
-        } else {
-          fileList.push(filePath);
+    const entries = fs.readdirSync(dir, { withFileTypes: true });
+    for (const entry of entries) {
+      if (entry.isDirectory()) {
+        if (!SKIP_DIRS.has(entry.name)) {
+          walkDir(path.join(dir, entry.name), fileList);
         }
-      } catch (err) {
-        // Skip inaccessible
+      } else if (ASSET_EXTENSIONS.has(path.extname(entry.name).toLowerCase())) {
+        fileList.push(path.join(dir, entry.name));
       }
     }
   } catch (err) {
@@ -48,21 +52,17 @@ function auditAssets(directory) {
 
   for (const filePath of files) {
     const file = path.basename(filePath);
-    const ext = path.extname(file).toLowerCase();
-
-    if (['.png', '.jpg', '.jpeg', '.svg'].includes(ext)) {
-      foundIcons.push(file);
+    foundIcons.push(file);
 
-      try {
-        const stat = fs.statSync(filePath);
-        const sizeKb = stat.size / 1024;
+    try {
+      const stat = fs.statSync(filePath);
+      const sizeKb = stat.size / 1024;
 
-        if (sizeKb > 100) {
-          issues.push(`[OPTIMIZATION] Asset '${file}' is too large (${sizeKb.toFixed(1)}KB). Max 100KB for extensions.`);
-        }
-      } catch (err) {
-        // Skip
+      if (sizeKb > 100) {
+        issues.push(`[OPTIMIZATION] Asset '${file}' is too large (${sizeKb.toFixed(1)}KB). Max 100KB for extensions.`);
       }
+    } catch (err) {
+      // Skip
     }
   }
 
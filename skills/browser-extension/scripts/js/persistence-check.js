@@ -11,6 +11,21 @@
 const fs = require('fs');
 const path = require('path');
 
+// Top-level let/var declarations (naive global detection)
+const GLOBALS_PATTERN = /^(?:let|var)\s+\w+\s*=/gm;
+
+/**
+ * Counts top-level let/var declarations without building a match array.
+ */
+function countGlobals(content) {
+  let count = 0;
+  GLOBALS_PATTERN.lastIndex = 0;
+  while (GLOBALS_PATTERN.exec(content) !== null) {
+    count++;
+  }
+  return count;
+}
+
 /**
  * Analyzes a Service Worker for persistence patterns.
  */
@@ -31,11 +46,10 @@ function checkPersistence(filepath) {
     }
 
     // RULE 3: Global Variables (Naive check)
-    const globalsPattern = /^(?:let|var)\s+\w+\s*=/gm;
-    const globalsFound = content.match(globalsPattern) || [];
+    const globalCount = countGlobals(content);
 
-    if (globalsFound.length > 2) {
-      issues.push(`[ARCHITECTURE] ${globalsFound.length} global variables detected. SW globals are ephemeral. Use storage.`);
+    if (globalCount > 2) {
+      issues.push(`[ARCHITECTURE] ${globalCount} global variables detected. SW globals are ephemeral. Use storage.`);
     }
   } catch (err) {
     issues.push(`[ERROR] Could not read service worker: ${err.message}`);
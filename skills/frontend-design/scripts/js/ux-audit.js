@@ -10,7 +10,24 @@
  */
 
 const fs = require('fs');
+const os = require('os');
 const path = require('path');
+const crypto = require('crypto');
+
+// Report rule, built once
+const RULE = '='.repeat(50);
+
+// Files read concurrently while auditing
+const READ_CONCURRENCY = 8;
+
+// Extensions collected by the file finder
+const AUDIT_EXTENSIONS = new Set(['.tsx', '.jsx', '.vue', '.svelte', '.html', '.css', '.svg', '.js', '.ts']);
+
+// Extensions scanned for violations (a subset of AUDIT_EXTENSIONS)
+const SCANNED_EXTENSIONS = new Set(['.tsx', '.jsx', '.ts', '.js', '.vue', '.svelte', '.css']);
+
+// Names skipped while walking (dependency, VCS and build output directories)
+const SKIP_NAMES = new Set(['node_modules', '.git', '.maestro', 'dist', 'build', '.next']);
 
 // 2025 Standard Configuration
 const CONFIG = {
@@ -42,30 +59,30 @@ const CONFIG = {
   }
 };
 
-/**
- * Scan a single file for design & security violations.
- */
-function scanFile(filepath) {
-  const issues = [];
-  let content = '';
+// Inline Framer Motion animate={{ ... }} props
+const ANIMATE_PROPS_REGEX = /animate=\{\{([^}]+)\}\}/;
 
-  try {
-    content = fs.readFileSync(filepath, 'utf-8');
-  } catch (err) {
-    return [`[ERROR] Could not read file: ${err.message}`];
-  }
+// Case-insensitive 'button' test without lowercasing the whole file
+const BUTTON_REGEX = /button/i;
 
-  const ext = path.extname(filepath);
-
-  // Skip non-code files
-  if (!['.tsx', '.jsx', '.ts', '.js', '.vue', '.svelte', '.css'].includes(ext)) {
-    return [];
-  }
+/**
+ * Whether a file's content is scanned at all. Decided from the name alone,
+ * so skipped files (markup, SVG, type declarations) are never read.
+ */
+function isScannable(filepath) {
+  return SCANNED_EXTENSIONS.has(path.extname(filepath)) && !filepath.endsWith('.d.ts');
+}
 
-  const isCss = ext === '.css';
-  const isArtComponent = filepath.toLowerCase().includes('visual') ||
-    filepath.toLowerCase().includes('art') ||
-    filepath.toLowerCase().includes('icon') ||
+/**
+ * Scan a single file's content for design & security violations.
+ */
+function scanFile(filepath, content) {
+  const issues = [];
+  const isCss = path.extname(filepath) === '.css';
+  const filepathLower = filepath.toLowerCase();
+  const isArtComponent = filepathLower.includes('visual') ||
+    filepathLower.includes('art') ||
+    filepathLower.includes('icon') ||
     content.includes('@css-art');
 
   // --- 1. MOTION PHYSICS & PERFORMANCE (2025 Standard) ---
@@ -77,7 +94,7 @@ function scanFile(filepath) {
     }
 
     // B. Jank Check (Layout Thrashing)
-    const animatingProps = content.match(/animate=\{\{([^}]+)\}\}/);
+    const animatingProps = content.match(ANIMATE_PROPS_REGEX);
     if (animatingProps) {
       CONFIG.motion.jank.forEach(prop => {
         if (animatingProps[1].includes(prop)) {
@@ -85,10 +102,8 @@ function scanFile(filepath) {
         }
       });
     }
-    if (content.match(/transition-[a-z]+/)) {
-      if (content.includes('transition-all')) {
-        issues.push(`[PERF-JANK] 'transition-all' is lazy and non-performant. Specify properties (opacity, transform).`);
-      }
+    if (content.includes('transition-all')) {
+      issues.push(`[PERF-JANK] 'transition-all' is lazy and non-performant. Specify properties (opacity, transform).`);
     }
 
     // C. Continuity
@@ -124,7 +139,7 @@ function scanFile(filepath) {
 
   // --- 3. MICRO-INTERACTION & HAPTICS ---
 
-  if (content.toLowerCase().includes('button') || content.includes('clickable')) {
+  if (BUTTON_REGEX.test(content) || content.includes('clickable')) {
     if (!content.includes('scale') && !content.includes('whileTap') && !content.includes('active:scale')) {
       issues.push(`[HAPTIC-VISUAL] Interactive element found without 'Press' effect (scale: 0.97 on active/tap).`);
     }
@@ -167,39 +182,199 @@ function scanFile(filepath) {
 }
 
 /**
- * Recursive File Finder
+ * Cache version: the auditor's own mtime and size, so editing the rules
+ * invalidates every cached result.
  */
-function findFiles(dir, extensions) {
-  let results = [];
+function getCacheVersion() {
   try {
-    const list = fs.readdirSync(dir);
-    list.forEach(file => {
-      const fullPath = path.join(dir, file);
-      if (['node_modules', '.git', '.maestro', 'dist', 'build', '.next'].includes(file)) return;
-
-      const stat = fs.statSync(fullPath);
-      if (stat && stat.isDirectory()) {
-        results = results.concat(findFiles(fullPath, extensions));
-      } else {
-        if (extensions.includes(path.extname(file))) {
-          results.push(fullPath);
-        }
+    const stat = fs.statSync(__filename);
+    return `${stat.mtimeMs}:${stat.size}`;
+  } catch (err) {
+    return null;
+  }
+}
+
+/**
+ * Cache file for an audit target, in the user cache directory and keyed by
+ * the resolved target path. Each audited tree keeps its own cache and
+ * nothing is written inside the project.
+ */
+function getCacheFile(targetDir) {
+  const key = crypto.createHash('md5').update(path.resolve(targetDir)).digest('hex').substring(0, 16);
+  return path.join(os.homedir(), '.cache', 'maestro', `ux-audit-${key}.json`);
+}
+
+/**
+ * Load cached per-file results. Returns an empty map when the cache is
+ * missing, unreadable or written by a different auditor version.
+ */
+function loadCache(cacheFile, version) {
+  try {
+    const data = JSON.parse(fs.readFileSync(cacheFile, 'utf-8'));
+    if (version && data.version === version && data.files) {
+      return data.files;
+    }
+  } catch (err) {
+    // Ignore
+  }
+  return {};
+}
+
+/**
+ * Save per-file results. Only files audited in this run are kept, so
+ * entries for deleted files drop out.
+ */
+function saveCache(cacheFile, version, files) {
+  if (!version) return;
+
+  // Pid-suffixed temp file so concurrent runs never write the same file
+  const tmpFile = `${cacheFile}.${process.pid}.tmp`;
+  try {
+    const dir = path.dirname(cacheFile);
+    if (!fs.existsSync(dir)) {
+      fs.mkdirSync(dir, { recursive: true });
+    }
+
+    fs.writeFileSync(tmpFile, JSON.stringify({ version, files }));
+    fs.renameSync(tmpFile, cacheFile);
+  } catch (err) {
+    try {
+      fs.unlinkSync(tmpFile);
+    } catch (cleanupErr) {
+      // Ignore
+    }
+  }
+}
+
+/**
+ * Read and scan a single file, reusing the cached result when the file's
+ * mtime and size are unchanged.
+ */
+async function auditFile(filepath, cache) {
+  // Skip non-code files before touching the disk
+  if (!isScannable(filepath)) {
+    return [];
+  }
+
+  const key = path.resolve(filepath);
+  let content = '';
+  let stat;
+
+  try {
+    stat = await fs.promises.stat(filepath);
+    const cached = cache.previous[key];
+    if (cached && cached.mtimeMs === stat.mtimeMs && cached.size === stat.size) {
+      cache.next[key] = cached;
+      return cached.issues;
+    }
+    // Empty files need no read. Everything else is read in full: the checks
+    // test for token presence, so a partial read could miss a violation
+    if (stat.size > 0) {
+      content = await fs.promises.readFile(filepath, 'utf-8');
+    }
+  } catch (err) {
+    return [`[ERROR] Could not read file: ${err.message}`];
+  }
+
+  const issues = scanFile(filepath, content);
+  cache.next[key] = { mtimeMs: stat.mtimeMs, size: stat.size, issues };
+  cache.misses++;
+  return issues;
+}
+
+/**
+ * Audit files with bounded read concurrency.
+ * Results keep the order of `files` so the report stays deterministic.
+ * With `failFast`, no new files are started once a violation is found;
+ * files never audited are left undefined in the results.
+ */
+async function auditFiles(files, cacheFile, failFast = false) {
+  const results = new Array(files.length);
+  let next = 0;
+  let failed = false;
+
+  const version = getCacheVersion();
+  const cache = { previous: loadCache(cacheFile, version), next: {}, misses: 0 };
+
+  async function worker() {
+    while (next < files.length && !failed) {
+      const index = next++;
+      results[index] = await auditFile(files[index], cache);
+      if (failFast && results[index].length > 0) {
+        failed = true;
       }
-    });
-  } catch (err) { }
+    }
+  }
+
+  const workers = Array.from({ length: Math.min(READ_CONCURRENCY, files.length) }, worker);
+  await Promise.all(workers);
+
+  // Keep cached results for files skipped by an early stop
+  for (let i = next; i < files.length; i++) {
+    const key = path.resolve(files[i]);
+    if (cache.previous[key]) {
+      cache.next[key] = cache.previous[key];
+    }
+  }
+
+  // Rewrite only when something was rescanned or a cached file disappeared
+  if (cache.misses > 0 || Object.keys(cache.previous).length !== Object.keys(cache.next).length) {
+    saveCache(cacheFile, version, cache.next);
+  }
+  return results;
+}
+
+/**
+ * File Finder: iterative depth-first walk (no recursion) that prunes
+ * excluded directories and returns files in the same pre-order as a
+ * recursive walk.
+ */
+function findFiles(dir, extensions) {
+  const results = [];
+  // Pending directories and matched files, popped in listing order
+  const stack = [{ fullPath: dir, isDir: true }];
+
+  while (stack.length > 0) {
+    const item = stack.pop();
+    if (!item.isDir) {
+      results.push(item.fullPath);
+      continue;
+    }
+
+    let entries;
+    try {
+      entries = fs.readdirSync(item.fullPath, { withFileTypes: true });
+    } catch (err) {
+      continue;
+    }
+
+    for (let i = entries.length - 1; i >= 0; i--) {
+      const entry = entries[i];
+      const file = entry.name;
+      if (SKIP_NAMES.has(file)) continue;
+
+      const isDir = entry.isDirectory();
+      if (isDir || extensions.has(path.extname(file))) {
+        stack.push({ fullPath: path.join(item.fullPath, file), isDir });
+      }
+    }
+  }
+
   return results;
 }
 
 /**
  * Main Execution
  */
-function main() {
-  console.log('\n🔍 MAESTRO ELITE FRONTEND AUDITOR (2025 Protocol)\n' + '='.repeat(50));
+async function main() {
+  console.log('\n🔍 MAESTRO ELITE FRONTEND AUDITOR (2025 Protocol)\n' + RULE);
 
-  const targetDir = process.argv[2] || '.';
-  const extensions = ['.tsx', '.jsx', '.vue', '.svelte', '.html', '.css', '.svg', '.js', '.ts'];
+  const args = process.argv.slice(2);
+  // --fail-fast: stop at the first file with violations (the verdict is already FAILURE)
+  const failFast = args.includes('--fail-fast');
+  const targetDir = args.find(arg => !arg.startsWith('--')) || '.';
 
-  const files = findFiles(targetDir, extensions);
+  const files = findFiles(targetDir, AUDIT_EXTENSIONS);
   let totalIssues = 0;
 
   if (files.length === 0) {
@@ -209,27 +384,40 @@ function main() {
 
   console.log(`\nScanning ${files.length} files for Architectural, Motion & Art violations...\n`);
 
-  files.forEach(file => {
-    const issues = scanFile(file);
-    if (issues.length > 0) {
-      console.log(`📂 ${path.relative(process.cwd(), file)}`);
+  const results = await auditFiles(files, getCacheFile(targetDir), failFast);
+
+  // Collect the report and emit it with a single write
+  const out = [];
+  let skipped = 0;
+  files.forEach((file, index) => {
+    const issues = results[index];
+    if (!issues) {
+      skipped++;
+    } else if (issues.length > 0) {
+      out.push(`📂 ${path.relative(process.cwd(), file)}`);
       issues.forEach(issue => {
-        console.log(`   ❌ ${issue}`);
+        out.push(`   ❌ ${issue}`);
         totalIssues++;
       });
-      console.log('');
+      out.push('');
     }
   });
 
-  console.log('='.repeat(50));
+  out.push(RULE);
   if (totalIssues > 0) {
-    console.log(`🚨 FAILURE: ${totalIssues} violations found.`);
-    console.log(`   Action: Check 'frontend_reference.md', 'animation_reference.md', or 'css_art_reference.md'`);
-    process.exit(1);
+    out.push(`🚨 FAILURE: ${totalIssues} violations found.`);
+    if (skipped > 0) {
+      out.push(`   (--fail-fast: stopped early, ${skipped} files not audited)`);
+    }
+    out.push(`   Action: Check 'frontend_reference.md', 'animation_reference.md', or 'css_art_reference.md'`);
   } else {
-    console.log(`✅ SUCCESS: System Integrity Verified (Art, Motion, Logic, Security).`);
-    process.exit(0);
+    out.push(`✅ SUCCESS: System Integrity Verified (Art, Motion, Logic, Security).`);
   }
+  process.stdout.write(out.join('\n') + '\n');
+
+  // Set the code rather than calling process.exit() so a large report
+  // piped to another process is fully flushed before exit
+  process.exitCode = totalIssues > 0 ? 1 : 0;
 }
 
 main();
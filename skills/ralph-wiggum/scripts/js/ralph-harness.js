@@ -20,6 +20,98 @@ const path = require('path');
 const crypto = require('crypto');
 const { spawnSync } = require('child_process');
 
+// Banner rule, built once instead of per printed line
+const RULE = '='.repeat(60);
+
+// Error categories in match priority order (first hit wins)
+const ERROR_CATEGORIES = [
+  ['syntax', ['syntaxerror', 'indentationerror']],
+  ['import', ['importerror', 'modulenotfounderror']],
+  ['type', ['typeerror']],
+  ['attribute', ['attributeerror']],
+  ['access', ['keyerror', 'indexerror']],
+  ['test_failure', ['assertionerror', 'fail']],
+  ['timeout', ['timeout']],
+  ['network', ['connection', 'network']]
+];
+
+// Keywords that mark a line of command output as relevant context
+const RELEVANT_LINE_REGEX = /error|fail|assert|exception|traceback/i;
+
+// Pivot guidance per strategy, built once at load
+const PIVOT_GUIDANCE = {
+  different_algorithm: `
+🔄 PIVOT STRATEGY: Different Algorithm
+
+The same error keeps occurring. The current approach is fundamentally flawed.
+
+ACTION REQUIRED:
+1. STOP what you're doing
+2. Delete or comment out the problematic code
+3. Research alternative algorithms for this problem
+4. Start with a completely different approach
+5. Run tests after each small change
+
+DO NOT: Try to patch the existing code again.
+`,
+  break_into_pieces: `
+🔄 PIVOT STRATEGY: Divide and Conquer
+
+The problem is too complex to solve at once.
+
+ACTION REQUIRED:
+1. Identify the smallest testable unit
+2. Create a separate function for just that unit
+3. Write a test for just that function
+4. Make the test pass
+5. Only then add the next piece
+
+DO NOT: Try to implement everything at once.
+`,
+  ask_clarification: `
+🔄 PIVOT STRATEGY: Seek Clarification
+
+After many attempts, the requirements may be unclear or impossible.
+
+ACTION REQUIRED:
+1. STOP implementation attempts
+2. List the specific blockers encountered
+3. Formulate clear questions about requirements
+4. Ask the user for clarification
+5. Do NOT proceed until requirements are clear
+
+DO NOT: Keep trying the same approach.
+`,
+  check_dependencies: `
+🔄 PIVOT STRATEGY: Check Dependencies
+
+Import errors suggest missing or misconfigured dependencies.
+
+ACTION REQUIRED:
+1. Check if all required packages are installed
+2. Verify package versions match requirements
+3. Check virtual environment activation
+4. Run: npm install / pip install -r requirements.txt
+5. Check for circular imports
+
+DO NOT: Assume imports will magically work.
+`,
+  rollback: `
+🔄 PIVOT STRATEGY: Rollback to Stable State
+
+Recent changes broke something that was working.
+
+ACTION REQUIRED:
+1. Find the last known working commit
+2. Run: git stash (save current work)
+3. Run: git checkout <last-good-commit>
+4. Verify tests pass
+5. Reapply changes more carefully
+
+DO NOT: Keep building on broken foundation.
+`
+};
+
 /**
  * CircuitBreaker - Enhanced Circuit Breaker with intelligent pivot strategies.
  */
@@ -27,6 +119,7 @@ class CircuitBreaker {
   static MAX_SAME_ERROR = 3;
   static MAX_ITERATIONS = 50;
   static TOKEN_BUDGET = 100000;
+  static MAX_HISTORY = 20;
 
   constructor(stateFile = null) {
     this.stateFile = stateFile || path.join(process.cwd(), '.maestro', 'circuit_breaker.json');
@@ -41,7 +134,7 @@ class CircuitBreaker {
     if (fs.existsSync(this.stateFile)) {
       try {
         const data = JSON.parse(fs.readFileSync(this.stateFile, 'utf-8'));
-        this.errorHistory = data.error_history || [];
+        this.errorHistory = (data.error_history || []).slice(-CircuitBreaker.MAX_HISTORY);
         this.iterationCount = data.iteration_count || 0;
         this.pivotCount = data.pivot_count || 0;
         this.lastStableCommit = data.last_stable_commit;
@@ -51,38 +144,60 @@ class CircuitBreaker {
     }
   }
 
-  _saveState() {
+  _saveState(timestamp = new Date().toISOString()) {
     const dir = path.dirname(this.stateFile);
     if (!fs.existsSync(dir)) {
       fs.mkdirSync(dir, { recursive: true });
     }
 
-    fs.writeFileSync(this.stateFile, JSON.stringify({
-      error_history: this.errorHistory.slice(-20),
-      iteration_count: this.iterationCount,
-      pivot_count: this.pivotCount,
-      last_stable_commit: this.lastStableCommit,
-      updated_at: new Date().toISOString()
-    }, null, 2));
+    // Compact JSON, written to a pid-suffixed temp file and renamed so a crash
+    // mid-write never leaves a truncated state file and concurrent runs never
+    // share a temp path
+    const tmpFile = `${this.stateFile}.${process.pid}.tmp`;
+    try {
+      fs.writeFileSync(tmpFile, JSON.stringify({
+        error_history: this.errorHistory,
+        iteration_count: this.iterationCount,
+        pivot_count: this.pivotCount,
+        last_stable_commit: this.lastStableCommit,
+        updated_at: timestamp
+      }));
+      fs.renameSync(tmpFile, this.stateFile);
+    } catch (err) {
+      try {
+        fs.unlinkSync(tmpFile);
+      } catch (cleanupErr) {
+        // Ignore
+      }
+      throw err;
+    }
   }
 
-  recordError(errorOutput, exitCode) {
+  recordError(errorOutput, exitCode, checksum = null) {
     this.iterationCount++;
 
-    const fingerprint = crypto.createHash('md5').update(errorOutput).digest('hex').substring(0, 12);
+    // Callers that already hashed the output pass the digest to avoid rehashing
+    const digest = checksum || crypto.createHash('md5').update(errorOutput).digest('hex');
+    const fingerprint = digest.substring(0, 12);
     const category = this._categorizeError(errorOutput);
+    // One timestamp for both the entry and the state's updated_at
+    const timestamp = new Date().toISOString();
 
     const entry = {
       iteration: this.iterationCount,
       fingerprint,
       category,
       exit_code: exitCode,
-      timestamp: new Date().toISOString(),
+      timestamp,
       output_preview: errorOutput.substring(0, 200)
     };
 
+    // Keep the history bounded in memory so saves never copy more than MAX_HISTORY
     this.errorHistory.push(entry);
-    this._saveState();
+    if (this.errorHistory.length > CircuitBreaker.MAX_HISTORY) {
+      this.errorHistory.shift();
+    }
+    this._saveState(timestamp);
 
     return entry;
   }
@@ -90,22 +205,10 @@ class CircuitBreaker {
   _categorizeError(output) {
     const outputLower = output.toLowerCase();
 
-    if (outputLower.includes('syntaxerror') || outputLower.includes('indentationerror')) {
-      return 'syntax';
-    } else if (outputLower.includes('importerror') || outputLower.includes('modulenotfounderror')) {
-      return 'import';
-    } else if (outputLower.includes('typeerror')) {
-      return 'type';
-    } else if (outputLower.includes('attributeerror')) {
-      return 'attribute';
-    } else if (outputLower.includes('keyerror') || outputLower.includes('indexerror')) {
-      return 'access';
-    } else if (outputLower.includes('assertionerror') || outputLower.includes('fail')) {
-      return 'test_failure';
-    } else if (outputLower.includes('timeout')) {
-      return 'timeout';
-    } else if (outputLower.includes('connection') || outputLower.includes('network')) {
-      return 'network';
+    for (const [category, keywords] of ERROR_CATEGORIES) {
+      if (keywords.some(kw => outputLower.includes(kw))) {
+        return category;
+      }
     }
     return 'unknown';
   }
@@ -144,80 +247,7 @@ class CircuitBreaker {
   }
 
   getPivotGuidance(strategy) {
-    const guidance = {
-      different_algorithm: `
-🔄 PIVOT STRATEGY: Different Algorithm
-
-The same error keeps occurring. The current approach is fundamentally flawed.
-
-ACTION REQUIRED:
-1. STOP what you're doing
-2. Delete or comment out the problematic code
-3. Research alternative algorithms for this problem
-4. Start with a completely different approach
-5. Run tests after each small change
-
-DO NOT: Try to patch the existing code again.
-`,
-      break_into_pieces: `
-🔄 PIVOT STRATEGY: Divide and Conquer
-
-The problem is too complex to solve at once.
-
-ACTION REQUIRED:
-1. Identify the smallest testable unit
-2. Create a separate function for just that unit
-3. Write a test for just that function
-4. Make the test pass
-5. Only then add the next piece
-
-DO NOT: Try to implement everything at once.
-`,
-      ask_clarification: `
-🔄 PIVOT STRATEGY: Seek Clarification
-
-After many attempts, the requirements may be unclear or impossible.
-
-ACTION REQUIRED:
-1. STOP implementation attempts
-2. List the specific blockers encountered
-3. Formulate clear questions about requirements
-4. Ask the user for clarification
-5. Do NOT proceed until requirements are clear
-
-DO NOT: Keep trying the same approach.
-`,
-      check_dependencies: `
-🔄 PIVOT STRATEGY: Check Dependencies
-
-Import errors suggest missing or misconfigured dependencies.
-
-ACTION REQUIRED:
-1. Check if all required packages are installed
-2. Verify package versions match requirements
-3. Check virtual environment activation
-4. Run: npm install / pip install -r requirements.txt
-5. Check for circular imports
-
-DO NOT: Assume imports will magically work.
-`,
-      rollback: `
-🔄 PIVOT STRATEGY: Rollback to Stable State
-
-Recent changes broke something that was working.
-
-ACTION REQUIRED:
-1. Find the last known working commit
-2. Run: git stash (save current work)
-3. Run: git checkout <last-good-commit>
-4. Verify tests pass
-5. Reapply changes more carefully
-
-DO NOT: Keep building on broken foundation.
-`
-    };
-
-    return guidance[strategy] || `Unknown strategy: ${strategy}`;
+    return PIVOT_GUIDANCE[strategy] || `Unknown strategy: ${strategy}`;
   }
 
   recordSuccess() {
@@ -265,20 +295,20 @@ function runAudit(command, cwd = null) {
 function formatErrorLog(output, maxLines = 20) {
   const lines = output.trim().split('\n');
 
-  const relevant = [];
-  for (let i = 0; i < lines.length; i++) {
-    const lineLower = lines[i].toLowerCase();
-    if (['error', 'fail', 'assert', 'exception', 'traceback'].some(kw => lineLower.includes(kw))) {
+  // Dedupe as we go and stop scanning once maxLines unique lines are collected
+  const relevant = new Set();
+  for (let i = 0; i < lines.length && relevant.size < maxLines; i++) {
+    if (RELEVANT_LINE_REGEX.test(lines[i])) {
       const start = Math.max(0, i - 2);
       const end = Math.min(lines.length, i + 3);
-      relevant.push(...lines.slice(start, end));
+      for (let j = start; j < end && relevant.size < maxLines; j++) {
+        relevant.add(lines[j]);
+      }
     }
   }
 
-  if (relevant.length > 0) {
-    // Dedupe and limit
-    const outputLines = [...new Set(relevant)].slice(0, maxLines);
-    return outputLines.join('\n');
+  if (relevant.size > 0) {
+    return [...relevant].join('\n');
   }
   return lines.slice(0, maxLines).join('\n');
 }
@@ -317,26 +347,26 @@ function main() {
     }
   }
 
-  console.log('='.repeat(60));
+  console.log(RULE);
   console.log('🔄 RALPH WIGGUM: SURGICAL AUTONOMOUS ORCHESTRATOR');
-  console.log('='.repeat(60));
+  console.log(RULE);
   console.log(`Target Command: ${command}`);
   console.log(`Max Iterations: ${maxLoops}`);
   console.log(`Project: ${projectDir}`);
   console.log(`Elite Mode: ${eliteMode ? 'ACTIVE' : 'Standard'}`);
-  console.log('='.repeat(60));
+  console.log(RULE);
 
   // Initialize circuit breaker
   const circuitBreaker = new CircuitBreaker(
     path.join(projectDir, '.maestro', 'circuit_breaker.json')
   );
 
-  const previousChecksums = [];
+  const previousChecksums = new Set();
 
   for (let i = 1; i <= maxLoops; i++) {
-    console.log(`\n${'='.repeat(60)}`);
+    console.log(`\n${RULE}`);
     console.log(`📍 ITERATION ${i}/${maxLoops}`);
-    console.log('='.repeat(60));
+    console.log(RULE);
 
     // Run the command
     const [code, output] = runAudit(command, projectDir);
@@ -344,38 +374,38 @@ function main() {
     // SUCCESS
     if (code === 0) {
       console.log('\n✅ SUCCESS SIGNAL DETECTED!');
-      console.log('='.repeat(60));
+      console.log(RULE);
       console.log('All tests/audits passed. Persistence loop concluded.');
-      console.log('='.repeat(60));
+      console.log(RULE);
 
       circuitBreaker.recordSuccess();
       process.exit(0);
     }
 
     // FAILURE - Record and analyze
-    const errorEntry = circuitBreaker.recordError(output, code);
     const currentChecksum = crypto.createHash('md5').update(output).digest('hex');
+    const errorEntry = circuitBreaker.recordError(output, code, currentChecksum);
 
     console.log(`\n❌ AUDIT FAILED (Exit Code: ${code})`);
     console.log(`   Error Category: ${errorEntry.category}`);
     console.log(`   Fingerprint: ${errorEntry.fingerprint}`);
 
     // Check for stagnation (legacy check)
-    if (previousChecksums.includes(currentChecksum)) {
+    if (previousChecksums.has(currentChecksum)) {
       console.log('\n🚨 STAGNATION DETECTED: Identical error output!');
     }
-    previousChecksums.push(currentChecksum);
+    previousChecksums.add(currentChecksum);
 
     // Check circuit breaker
     const [shouldPivot, reason, strategy] = circuitBreaker.shouldPivot();
 
     if (shouldPivot) {
-      console.log('\n' + '='.repeat(60));
+      console.log('\n' + RULE);
       console.log('🚨 CIRCUIT BREAKER TRIGGERED');
-      console.log('='.repeat(60));
+      console.log(RULE);
       console.log(`Reason: ${reason}`);
       console.log(circuitBreaker.getPivotGuidance(strategy));
-      console.log('='.repeat(60));
+      console.log(RULE);
       console.log('\nAutomation cannot solve this problem.');
       console.log('Manual intervention or strategy change required.');
 
@@ -411,9 +441,9 @@ function main() {
   }
 
   // Max loops exhausted
-  console.log('\n' + '='.repeat(60));
+  console.log('\n' + RULE);
   console.log('🚨 MAX ITERATIONS EXHAUSTED');
-  console.log('='.repeat(60));
+  console.log(RULE);
   console.log('Persistence limit reached without success.');
   console.log('\nCircuit breaker recommends:');
   console.log(circuitBreaker.getPivotGuidance('ask_clarification'));
@@ -62,10 +62,23 @@ class RalphSurgicalEngine {
     if (!fs.existsSync(this.stateDir)) {
       fs.mkdirSync(this.stateDir, { recursive: true });
     }
-    fs.writeFileSync(this.stateFile, JSON.stringify({
-      ...this.state,
-      updated_at: new Date().toISOString()
-    }, null, 2));
+    // Compact JSON via pid-suffixed temp file + rename: readers never see a
+    // partial write and concurrent runs never share a temp path
+    const tmpFile = `${this.stateFile}.${process.pid}.tmp`;
+    try {
+      fs.writeFileSync(tmpFile, JSON.stringify({
+        ...this.state,
+        updated_at: new Date().toISOString()
+      }));
+      fs.renameSync(tmpFile, this.stateFile);
+    } catch (err) {
+      try {
+        fs.unlinkSync(tmpFile);
+      } catch (cleanupErr) {
+        // Ignore
+      }
+      throw err;
+    }
   }
 
   // =========================================================================
@@ -17,6 +17,14 @@ const IssueSeverity = {
   CRITICAL: 'critical'
 };
 
+// Severity ordering, used to find the worst issue in a single pass
+const SEVERITY_RANK = {
+  [IssueSeverity.NONE]: 0,
+  [IssueSeverity.MINOR]: 1,
+  [IssueSeverity.MAJOR]: 2,
+  [IssueSeverity.CRITICAL]: 3
+};
+
 // Issue Categories
 const IssueCategory = {
   EDGE_CASE_MISSING: 'edge_case_missing',
@@ -142,12 +150,10 @@ class ReflectionLoop {
 
     // Determine overall severity
     let overall = IssueSeverity.NONE;
-    if (issues.some(i => i.severity === IssueSeverity.CRITICAL)) {
-      overall = IssueSeverity.CRITICAL;
-    } else if (issues.some(i => i.severity === IssueSeverity.MAJOR)) {
-      overall = IssueSeverity.MAJOR;
-    } else if (issues.some(i => i.severity === IssueSeverity.MINOR)) {
-      overall = IssueSeverity.MINOR;
+    for (const issue of issues) {
+      if ((SEVERITY_RANK[issue.severity] || 0) > SEVERITY_RANK[overall]) {
+        overall = issue.severity;
+      }
     }
 
     // Determine if refinement needed
@@ -349,9 +355,18 @@ class ReflectionLoop {
 
 `;
 
-    const critical = result.issues.filter(i => i.severity === IssueSeverity.CRITICAL);
-    const major = result.issues.filter(i => i.severity === IssueSeverity.MAJOR);
-    const minor = result.issues.filter(i => i.severity === IssueSeverity.MINOR);
+    const critical = [];
+    const major = [];
+    const minor = [];
+    for (const issue of result.issues) {
+      if (issue.severity === IssueSeverity.CRITICAL) {
+        critical.push(issue);
+      } else if (issue.severity === IssueSeverity.MAJOR) {
+        major.push(issue);
+      } else if (issue.severity === IssueSeverity.MINOR) {
+        minor.push(issue);
+      }
+    }
 
     if (critical.length > 0) {
       guidance += '#### 🔴 CRITICAL (Must Fix):\n';